@@ -0,0 +1,110 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled counterparts of the numeric kernels in app.py.
+
+Build with ``python setup.py build_ext --inplace``, then run ``python check_core.py``,
+which compares these against the pure-Python versions over a grid of inputs. app.py
+uses the extension whenever it imports, so a scoring rule changed in app.py must be
+changed here too and the build re-checked.
+"""
+
+from libc.math cimport exp, log1p, rint
+from libc.stdint cimport int64_t
+
+import numpy as np
+
+
+cdef double _annuity_factor(int64_t rate_bps, int64_t months):
+    cdef double monthly_rate = rate_bps / 100.0 / 12.0 / 100.0
+    cdef double factor
+    if monthly_rate == 0:
+        return 1.0 / months
+    factor = exp(months * log1p(monthly_rate))
+    return monthly_rate * factor / (factor - 1)
+
+
+cpdef double emi_c(double principal, double annual_rate, int64_t months):
+    # rint() rounds half to even, matching the round() used by app.emi.
+    return principal * _annuity_factor(<int64_t>rint(annual_rate * 100), months)
+
+
+cpdef tuple profile_risk_c(int64_t credit_score, double foir, double stability):
+    cdef int64_t risk_score = 100
+
+    if credit_score >= 760:
+        risk_score -= 35
+    elif credit_score >= 700:
+        risk_score -= 22
+    elif credit_score >= 650:
+        risk_score -= 10
+
+    if foir <= 0.35:
+        risk_score -= 25
+    elif foir <= 0.45:
+        risk_score -= 15
+    elif foir <= 0.55:
+        risk_score -= 5
+    else:
+        risk_score += 20
+
+    if stability >= 0.95:
+        risk_score -= 12
+    elif stability < 0.8:
+        risk_score += 10
+
+    risk_score = max(5, min(95, risk_score))
+
+    if risk_score <= 35:
+        return "Low", risk_score
+    if risk_score <= 60:
+        return "Medium", risk_score
+    return "High", risk_score
+
+
+def score_banks_c(
+    const double[::1] base_rate,
+    const int64_t[::1] min_credit,
+    const double[::1] max_foir,
+    int64_t credit_score,
+    double foir,
+    double stability,
+    double principal,
+    int64_t months,
+    double monthly_income,
+    double existing_emi,
+    int64_t confidence,
+):
+    cdef Py_ssize_t n = base_rate.shape[0]
+    cdef Py_ssize_t i
+    cdef double credit_adjustment, foir_adjustment, stability_adjustment
+    cdef double rate, fit
+
+    effective_rate = np.empty(n, dtype=np.float64)
+    monthly_emi = np.empty(n, dtype=np.float64)
+    actual_foir = np.empty(n, dtype=np.float64)
+    bank_fit = np.empty(n, dtype=np.int64)
+    eligible = np.empty(n, dtype=np.bool_)
+
+    cdef double[::1] effective_rate_v = effective_rate
+    cdef double[::1] monthly_emi_v = monthly_emi
+    cdef double[::1] actual_foir_v = actual_foir
+    cdef int64_t[::1] bank_fit_v = bank_fit
+    cdef unsigned char[::1] eligible_v = eligible.view(np.uint8)
+
+    credit_adjustment = -0.35 if credit_score >= 760 else (-0.15 if credit_score >= 720 else 0.2)
+    foir_adjustment = -0.1 if foir <= 0.4 else (0.25 if foir > 0.5 else 0.0)
+    stability_adjustment = -0.1 if stability >= 1 else (0.2 if stability < 0.8 else 0.0)
+
+    for i in range(n):
+        # Same rounding as np.around(x, 2): scale, round half to even, unscale.
+        rate = rint(max(base_rate[i] + credit_adjustment + foir_adjustment + stability_adjustment, 7.75) * 100) / 100
+        effective_rate_v[i] = rate
+
+        monthly_emi_v[i] = principal * _annuity_factor(<int64_t>rint(rate * 100), months)
+        actual_foir_v[i] = (existing_emi + monthly_emi_v[i]) / monthly_income
+
+        eligible_v[i] = credit_score >= min_credit[i] and actual_foir_v[i] <= max_foir[i]
+
+        fit = 100 - (rate - base_rate[i]) * 10 - max(actual_foir_v[i] - 0.35, 0.0) * 120 + (confidence - 50) * 0.2
+        bank_fit_v[i] = <int64_t>min(max(fit, 35.0), 98.0)
+
+    return effective_rate, monthly_emi, actual_foir, bank_fit, eligible
@@ -1,54 +1,180 @@
 ﻿import math
 import os
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque, namedtuple
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, fields
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from threading import Condition, Thread
 
 import joblib
 import numpy as np
 from flask import Flask, flash, redirect, render_template, request, session, url_for
+from jinja2 import FileSystemBytecodeCache
 from werkzeug.security import check_password_hash, generate_password_hash
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; without it the kernels run as plain NumPy.
+
+    def njit(*args, **kwargs):
+        def decorate(func):
+            return func
+
+        return decorate
+
 app = Flask(__name__)
 app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "smartloan360-dev-secret")
+# Compiled templates are cached on disk so each worker skips Jinja compilation on first render.
+# Template auto-reload already follows app.debug, so it stays off under gunicorn.
+_JINJA_CACHE_DIR = os.getenv("JINJA_CACHE_DIR")
+if _JINJA_CACHE_DIR:
+    try:
+        os.makedirs(_JINJA_CACHE_DIR, exist_ok=True)
+    except OSError:
+        pass
+# Jinja writes the cache while rendering, so an unusable directory would fail every page.
+if not _JINJA_CACHE_DIR or os.access(_JINJA_CACHE_DIR, os.W_OK | os.X_OK):
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_JINJA_CACHE_DIR)
+else:
+    app.logger.warning("JINJA_CACHE_DIR %s is not writable. Template bytecode caching is disabled.", _JINJA_CACHE_DIR)
+
+_MODEL_PATH = Path(__file__).parent / "model.pkl"
 
 
 class FallbackModel:
-    def predict(self, X):
-        monthly_income, loan_amount, credit_score = X[0]
+    def _is_eligible(self, monthly_income, loan_amount, credit_score):
         income_gate = monthly_income >= (loan_amount / 120)
         credit_gate = credit_score >= 650
-        return np.array([1 if income_gate and credit_gate else 0])
+        return income_gate and credit_gate
 
-    def predict_proba(self, X):
-        monthly_income, loan_amount, credit_score = X[0]
+    def _approval_probability(self, monthly_income, loan_amount, credit_score):
         score = 0.22
         score += min(max((credit_score - 500) / 360, 0), 0.53)
         score += min(max((monthly_income - (loan_amount / 120)) / 120000, 0), 0.2)
-        approved = min(max(score, 0.05), 0.95)
-        return np.array([[1 - approved, approved]])
+        return min(max(score, 0.05), 0.95)
+
+    def score(self, monthly_income, loan_amount, credit_score):
+        prediction = 1 if self._is_eligible(monthly_income, loan_amount, credit_score) else 0
+        confidence = int(round(self._approval_probability(monthly_income, loan_amount, credit_score) * 100))
+        return prediction, confidence
+
+    # predict/predict_proba return arrays over every row, like sklearn, so the model can also be
+    # handed to PredictionBatcher. dashboard calls score() to keep NumPy off the single-row path.
+    def predict(self, X):
+        return np.array([1 if self._is_eligible(*row) else 0 for row in X])
+
+    def predict_proba(self, X):
+        approved = np.array([self._approval_probability(*row) for row in X])
+        return np.column_stack((1 - approved, approved))
 
 
 def load_model():
-    model_path = Path(__file__).resolve().parent / "model.pkl"
-    if model_path.exists():
-        return joblib.load(model_path)
-    app.logger.warning("model.pkl not found. Falling back to rules-based model.")
-    return FallbackModel()
+    try:
+        return joblib.load(_MODEL_PATH)
+    except FileNotFoundError:
+        app.logger.warning("model.pkl not found. Falling back to rules-based model.")
+        return FallbackModel()
+
+
+class PredictionBatcher:
+    """Coalesces concurrent single-row predictions into one batched model call.
+
+    A row submitted while no prediction is running is scored inline on the caller's thread, so a
+    sync gunicorn worker never waits. Rows submitted while a prediction is running queue up, and a
+    background thread scores them together as soon as it is free.
+
+    Batching only happens under threaded workers (e.g. gunicorn's gthread). The Procfile and
+    render.yaml run the default sync worker, which serves one request at a time, so there every
+    row is scored inline and this gives no throughput gain.
+    """
+
+    def __init__(self, model, max_batch=32):
+        self.model = model
+        self.max_batch = max_batch
+        self._queue = deque()
+        self._cond = Condition()
+        self._running = 0
+        self._worker = None
+
+    def submit(self, features):
+        future = Future()
+        with self._cond:
+            inline = self._running == 0 and not self._queue
+            if inline:
+                self._running += 1
+            else:
+                # Started lazily so each forked gunicorn worker gets its own thread.
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = Thread(target=self._run, name="prediction-batcher", daemon=True)
+                    self._worker.start()
+                self._queue.append((features, future))
+                self._cond.notify()
+        if inline:
+            self._score([(features, future)])
+        return future
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                batch = [self._queue.popleft() for _ in range(min(len(self._queue), self.max_batch))]
+                self._running += 1
+            self._score(batch)
+
+    def _score(self, batch):
+        try:
+            self._predict(batch)
+        finally:
+            with self._cond:
+                self._running -= 1
+
+    def _predict(self, batch):
+        # Any failure is delivered to every caller in the batch; a dropped future would block its request.
+        try:
+            X = np.vstack([features for features, _ in batch])
+            predictions = self.model.predict(X)
+            probabilities = self.model.predict_proba(X)[:, 1]
+            results = [
+                (int(prediction), int(round(float(probability * 100))))
+                for prediction, probability in zip(predictions, probabilities)
+            ]
+            if len(results) != len(batch):
+                raise ValueError(f"model returned {len(results)} predictions for {len(batch)} rows")
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
 
 
 model = load_model()
+prediction_batcher = PredictionBatcher(model)
+PREDICTION_TIMEOUT = 5
+
+# Two fixed demo accounts don't need Werkzeug's default ~600k PBKDF2 rounds; a lower count keeps
+# login CPU low. The dummy hash uses the same method so unknown users still take as long.
+_DEMO_HASH_METHOD = "pbkdf2:sha256:50000"
 
 USERS = {
     "admin": {
-        "password": generate_password_hash("smartloan360"),
+        "password": generate_password_hash("smartloan360", method=_DEMO_HASH_METHOD),
         "name": "Platform Admin",
     },
     "analyst": {
-        "password": generate_password_hash("loanmarket123"),
+        "password": generate_password_hash("loanmarket123", method=_DEMO_HASH_METHOD),
         "name": "Credit Analyst",
     },
 }
 
+_USER_HASHES = {username: user["password"] for username, user in USERS.items()}
+_DUMMY_HASH = generate_password_hash("smartloan360-unknown-user", method=_DEMO_HASH_METHOD)
+
 BANKS = {
     "Home": [
         {"name": "SBI", "base_rate": 8.35, "min_credit": 680, "max_foir": 0.55, "processing_fee": 0.6},
@@ -73,6 +199,28 @@ BANKS = {
     ],
 }
 
+# Keep each lender table ordered by base rate. Effective rates apply the same shift to every bank,
+# so eligible offers already come out in rate order and the final sort only settles ties.
+for banks in BANKS.values():
+    banks.sort(key=lambda bank: bank["base_rate"])
+
+BankTable = namedtuple("BankTable", "name base_rate min_credit max_foir processing_fee")
+
+# Column-per-field copies of BANKS for the scoring kernels. Parallel contiguous arrays are
+# used rather than a record array, whose fields would be strided views over interleaved rows.
+BANKS_NP = {
+    loan_type: BankTable(
+        name=tuple(bank["name"] for bank in banks),
+        base_rate=np.array([bank["base_rate"] for bank in banks], dtype=np.float64),
+        min_credit=np.array([bank["min_credit"] for bank in banks], dtype=np.int64),
+        max_foir=np.array([bank["max_foir"] for bank in banks], dtype=np.float64),
+        processing_fee=np.array([bank["processing_fee"] for bank in banks], dtype=np.float64),
+    )
+    for loan_type, banks in BANKS.items()
+}
+
+Offer = namedtuple("Offer", "bank rate emi total_payable processing_fee approval foir tag")
+
 EMPLOYMENT_STABILITY = {
     "salaried": 1.0,
     "self_employed": 0.85,
@@ -80,49 +228,117 @@ EMPLOYMENT_STABILITY = {
 }
 
 
+# Risk adjustments as sorted thresholds plus one adjustment per bucket. Credit score and
+# stability thresholds are inclusive lower bounds; FOIR and label thresholds are inclusive upper bounds.
+# profile_risk_c in _core.pyx repeats these rules; change it too and run check_core.py.
+_CREDIT_RISK_THR = (650, 700, 760)
+_CREDIT_RISK_ADJ = (0, -10, -22, -35)
+_FOIR_RISK_THR = (0.35, 0.45, 0.55)
+_FOIR_RISK_ADJ = (-25, -15, -5, 20)
+_STABILITY_RISK_THR = (0.8, 0.95)
+_STABILITY_RISK_ADJ = (10, 0, -12)
+_RISK_LABEL_THR = (35, 60)
+_RISK_LABELS = ("Low", "Medium", "High")
+
+
+@dataclass
+class LoanApplication:
+    full_name: str = "Applicant"
+    age: int = 0
+    employment: str = "salaried"
+    monthly_income: float = 0
+    monthly_expenses: float = 0
+    existing_emi: float = 0
+    credit_score: int = 0
+    loan_amount: float = 0
+    tenure_months: int = 0
+    loan_type: str = "Home"
+
+    def __post_init__(self):
+        self.full_name = self.full_name.strip() or "Applicant"
+
+    @classmethod
+    def from_form(cls, form):
+        # ValueError from a parser propagates to the caller.
+        return cls(**{name: parse(form.get(name, default)) for name, parse, default in _APPLICATION_FIELDS})
+
+    def validation_errors(self):
+        errors = []
+        # float() accepts "nan" and "inf", which slip past the range checks below.
+        amounts = (self.monthly_income, self.monthly_expenses, self.existing_emi, self.loan_amount)
+        if not all(math.isfinite(amount) for amount in amounts):
+            errors.append("Income, expenses, EMI, and loan amount must be finite numbers.")
+        if self.loan_type not in BANKS:
+            errors.append("Unsupported loan type selected.")
+        if not (21 <= self.age <= 65):
+            errors.append("Age should be between 21 and 65 years.")
+        if self.monthly_income <= 0 or self.loan_amount <= 0 or self.tenure_months < 12:
+            errors.append("Income, loan amount, and tenure should be valid positive values.")
+        if self.monthly_expenses < 0 or self.existing_emi < 0:
+            errors.append("Expenses and existing EMI cannot be negative.")
+        if not (300 <= self.credit_score <= 900):
+            errors.append("Credit score must be between 300 and 900.")
+        return errors
+
+
+# Form parser per LoanApplication field. Parsers are listed explicitly rather than taken from the
+# annotations, which may be strings or typing constructs such as Optional[int].
+_FORM_PARSERS = (
+    ("full_name", str),
+    ("age", int),
+    ("employment", str),
+    ("monthly_income", float),
+    ("monthly_expenses", float),
+    ("existing_emi", float),
+    ("credit_score", int),
+    ("loan_amount", float),
+    ("tenure_months", int),
+    ("loan_type", str),
+)
+_FIELD_DEFAULTS = {field.name: field.default for field in fields(LoanApplication)}
+_APPLICATION_FIELDS = tuple((name, parse, _FIELD_DEFAULTS[name]) for name, parse in _FORM_PARSERS)
+
+
 def login_required():
     return "username" in session
 
 
-def emi(principal, annual_rate, months):
-    monthly_rate = annual_rate / 12 / 100
+_TS_CACHE = (0, "")
+
+
+def _now_str():
+    # Reuse the formatted timestamp within the same second. The cache is swapped as a
+    # single tuple, so concurrent requests at worst format the same second twice.
+    global _TS_CACHE
+    epoch_second = int(time.time())
+    cached_second, formatted = _TS_CACHE
+    if epoch_second != cached_second:
+        formatted = datetime.fromtimestamp(epoch_second).strftime("%d %b %Y, %I:%M %p")
+        _TS_CACHE = (epoch_second, formatted)
+    return formatted
+
+
+@lru_cache(maxsize=4096)
+def _annuity_factor(rate_bps, months):
+    monthly_rate = rate_bps / 100 / 12 / 100
     if monthly_rate == 0:
-        return principal / months
-    factor = (1 + monthly_rate) ** months
-    return principal * monthly_rate * factor / (factor - 1)
+        return 1 / months
+    factor = math.exp(months * math.log1p(monthly_rate))
+    return monthly_rate * factor / (factor - 1)
 
 
-def profile_risk(credit_score, foir, stability):
-    risk_score = 100
+def emi(principal, annual_rate, months):
+    # Rates are quoted to two decimals, so basis points give a stable cache key.
+    return principal * _annuity_factor(int(round(annual_rate * 100)), int(months))
 
-    if credit_score >= 760:
-        risk_score -= 35
-    elif credit_score >= 700:
-        risk_score -= 22
-    elif credit_score >= 650:
-        risk_score -= 10
-
-    if foir <= 0.35:
-        risk_score -= 25
-    elif foir <= 0.45:
-        risk_score -= 15
-    elif foir <= 0.55:
-        risk_score -= 5
-    else:
-        risk_score += 20
-
-    if stability >= 0.95:
-        risk_score -= 12
-    elif stability < 0.8:
-        risk_score += 10
 
+def profile_risk(credit_score, foir, stability):
+    risk_score = 100
+    risk_score += _CREDIT_RISK_ADJ[bisect_right(_CREDIT_RISK_THR, credit_score)]
+    risk_score += _FOIR_RISK_ADJ[bisect_left(_FOIR_RISK_THR, foir)]
+    risk_score += _STABILITY_RISK_ADJ[bisect_right(_STABILITY_RISK_THR, stability)]
     risk_score = max(5, min(95, risk_score))
-
-    if risk_score <= 35:
-        return "Low", risk_score
-    if risk_score <= 60:
-        return "Medium", risk_score
-    return "High", risk_score
+    return _RISK_LABELS[bisect_left(_RISK_LABEL_THR, risk_score)], risk_score
 
 
 def explain_profile(data, decision_confidence, risk_label):
@@ -151,54 +367,111 @@ def explain_profile(data, decision_confidence, risk_label):
     return reasons, cautions
 
 
-def build_offers(profile, prediction, confidence):
-    offers = []
+@njit(cache=True)
+def _score_banks(
+    base_rate,
+    min_credit,
+    max_foir,
+    credit_score,
+    foir,
+    stability,
+    principal,
+    months,
+    monthly_income,
+    existing_emi,
+    confidence,
+):
+    # score_banks_c in _core.pyx repeats these rate, FOIR and fit rules; change it too and run check_core.py.
+    credit_adjustment = -0.35 if credit_score >= 760 else (-0.15 if credit_score >= 720 else 0.2)
+    foir_adjustment = -0.1 if foir <= 0.4 else (0.25 if foir > 0.5 else 0.0)
+    stability_adjustment = -0.1 if stability >= 1 else (0.2 if stability < 0.8 else 0.0)
+
+    effective_rate = np.around(np.maximum(base_rate + credit_adjustment + foir_adjustment + stability_adjustment, 7.75), 2)
+
+    # Same annuity factor as _annuity_factor(), so a bank EMI equals emi() at that rate. Rates are
+    # floored at 7.75%, so the zero-rate branch never applies here.
+    monthly_rate = effective_rate / 12 / 100
+    factor = np.exp(months * np.log1p(monthly_rate))
+    monthly_emi = principal * (monthly_rate * factor / (factor - 1))
+    actual_foir = (existing_emi + monthly_emi) / monthly_income
+
+    eligible = (credit_score >= min_credit) & (actual_foir <= max_foir)
+
+    bank_fit = 100 - (effective_rate - base_rate) * 10 - np.maximum(actual_foir - 0.35, 0.0) * 120 + (confidence - 50) * 0.2
+    bank_fit = np.clip(bank_fit, 35, 98).astype(np.int64)
+
+    return effective_rate, monthly_emi, actual_foir, bank_fit, eligible
+
+
+try:  # Compiled versions of emi, profile_risk and _score_banks; see _core.pyx.
+    import _core
+except ImportError:
+    _core = None
+
+# check_core.py verifies a build against the Python kernels; it is not re-checked here.
+if _core is not None:
+    emi, profile_risk, _score_banks = _core.emi_c, _core.profile_risk_c, _core.score_banks_c
+
+
+def _make_offer_builder(banks):
+    # Bind one lender table up front so per-request work skips the loan-type lookup and the
+    # per-bank float conversions of constants.
+    base_rate, min_credit, max_foir = banks.base_rate, banks.min_credit, banks.max_foir
+    names = banks.name
+    base_rates = base_rate.tolist()
+    processing_fees = banks.processing_fee.tolist()
+    quoted_fees = tuple(round(fee, 2) for fee in processing_fees)
+
+    def build(profile, confidence):
+        loan_amount = profile["loan_amount"]
+        tenure_months = profile["tenure_months"]
+
+        effective_rate, monthly_emi, actual_foir, bank_fit, eligible = _score_banks(
+            base_rate,
+            min_credit,
+            max_foir,
+            profile["credit_score"],
+            profile["foir"],
+            profile["stability"],
+            loan_amount,
+            tenure_months,
+            profile["monthly_income"],
+            profile["existing_emi"],
+            confidence,
+        )
 
-    if prediction != 1:
+        offers = []
+        for i in np.flatnonzero(eligible).tolist():
+            rate = float(effective_rate[i])
+            bank_emi = float(monthly_emi[i])
+            payable = bank_emi * tenure_months
+            processing = loan_amount * (processing_fees[i] / 100)
+            offers.append(
+                Offer(
+                    bank=names[i],
+                    rate=rate,
+                    emi=int(round(bank_emi)),
+                    total_payable=int(round(payable + processing)),
+                    processing_fee=quoted_fees[i],
+                    approval=int(bank_fit[i]),
+                    foir=round(float(actual_foir[i]) * 100, 1),
+                    tag="Best Rate" if rate <= base_rates[i] else "Fast Approval",
+                )
+            )
+
+        offers.sort(key=lambda x: (x.rate, -x.approval, x.emi))
         return offers
 
-    for bank in BANKS[profile["loan_type"]]:
-        if profile["credit_score"] < bank["min_credit"]:
-            continue
-
-        base_rate = bank["base_rate"]
-        credit_adjustment = -0.35 if profile["credit_score"] >= 760 else (-0.15 if profile["credit_score"] >= 720 else 0.2)
-        foir_adjustment = -0.1 if profile["foir"] <= 0.4 else (0.25 if profile["foir"] > 0.5 else 0)
-        stability_adjustment = -0.1 if profile["stability"] >= 1 else (0.2 if profile["stability"] < 0.8 else 0)
-
-        effective_rate = round(max(base_rate + credit_adjustment + foir_adjustment + stability_adjustment, 7.75), 2)
-
-        monthly_emi = emi(profile["loan_amount"], effective_rate, profile["tenure_months"])
-        combined_obligation = profile["existing_emi"] + monthly_emi
-        actual_foir = combined_obligation / profile["monthly_income"]
-
-        if actual_foir > bank["max_foir"]:
-            continue
-
-        payable = monthly_emi * profile["tenure_months"]
-        processing = profile["loan_amount"] * (bank["processing_fee"] / 100)
-
-        bank_fit = 100
-        bank_fit -= (effective_rate - bank["base_rate"]) * 10
-        bank_fit -= max(actual_foir - 0.35, 0) * 120
-        bank_fit += (confidence - 50) * 0.2
-        bank_fit = int(max(35, min(98, bank_fit)))
-
-        offers.append(
-            {
-                "bank": bank["name"],
-                "rate": effective_rate,
-                "emi": int(round(monthly_emi)),
-                "total_payable": int(round(payable + processing)),
-                "processing_fee": round(bank["processing_fee"], 2),
-                "approval": bank_fit,
-                "foir": round(actual_foir * 100, 1),
-                "tag": "Best Rate" if effective_rate <= base_rate else "Fast Approval",
-            }
-        )
+    return build
+
+
+_OFFER_BUILDERS = {loan_type: _make_offer_builder(banks) for loan_type, banks in BANKS_NP.items()}
 
-    offers.sort(key=lambda x: (x["rate"], -x["approval"], x["emi"]))
-    return offers
+
+def build_offers(profile, prediction, confidence):
+    if prediction != 1:
+        return []
+    return _OFFER_BUILDERS[profile["loan_type"]](profile, confidence)
 
 
 @app.route("/", methods=["GET", "POST"])
@@ -210,10 +483,13 @@ def login():
         username = request.form.get("username", "").strip().lower()
         password = request.form.get("password", "")
 
-        user = USERS.get(username)
-        if user and check_password_hash(user["password"], password):
+        password_hash = _USER_HASHES.get(username)
+        if password_hash is None:
+            # Verify against a throwaway hash so unknown usernames take as long as wrong passwords.
+            check_password_hash(_DUMMY_HASH, password)
+        elif check_password_hash(password_hash, password):
             session["username"] = username
-            session["name"] = user["name"]
+            session["name"] = USERS[username]["name"]
             return redirect(url_for("dashboard"))
 
         flash("Invalid credentials. Use admin/smartloan360 for demo access.", "error")
@@ -234,68 +510,46 @@ def dashboard():
 
     if request.method == "POST":
         try:
-            full_name = request.form.get("full_name", "Applicant").strip() or "Applicant"
-            age = int(request.form.get("age", 0))
-            employment = request.form.get("employment", "salaried")
-            monthly_income = float(request.form.get("monthly_income", 0))
-            monthly_expenses = float(request.form.get("monthly_expenses", 0))
-            existing_emi = float(request.form.get("existing_emi", 0))
-            credit_score = int(request.form.get("credit_score", 0))
-            loan_amount = float(request.form.get("loan_amount", 0))
-            tenure_months = int(request.form.get("tenure_months", 0))
-            loan_type = request.form.get("loan_type", "Home")
+            application = LoanApplication.from_form(request.form)
         except ValueError:
             flash("Invalid numeric input. Please review your profile values.", "error")
             return redirect(url_for("dashboard"))
 
-        if loan_type not in BANKS:
-            flash("Unsupported loan type selected.", "error")
-            return redirect(url_for("dashboard"))
-
-        if not (21 <= age <= 65):
-            flash("Age should be between 21 and 65 years.", "error")
-            return redirect(url_for("dashboard"))
-
-        if monthly_income <= 0 or loan_amount <= 0 or tenure_months < 12:
-            flash("Income, loan amount, and tenure should be valid positive values.", "error")
-            return redirect(url_for("dashboard"))
-
-        if monthly_expenses < 0 or existing_emi < 0:
-            flash("Expenses and existing EMI cannot be negative.", "error")
+        errors = application.validation_errors()
+        if errors:
+            flash(" ".join(errors), "error")
             return redirect(url_for("dashboard"))
 
-        if not (300 <= credit_score <= 900):
-            flash("Credit score must be between 300 and 900.", "error")
-            return redirect(url_for("dashboard"))
+        monthly_income = application.monthly_income
+        loan_amount = application.loan_amount
+        credit_score = application.credit_score
+        existing_emi = application.existing_emi
 
-        stability = EMPLOYMENT_STABILITY.get(employment, 0.8)
-        disposable_income = max(monthly_income - monthly_expenses - existing_emi, 0)
+        stability = EMPLOYMENT_STABILITY.get(application.employment, 0.8)
+        disposable_income = max(monthly_income - application.monthly_expenses - existing_emi, 0)
 
-        baseline_emi = emi(loan_amount, 10.0, tenure_months)
+        baseline_emi = emi(loan_amount, 10.0, application.tenure_months)
         foir = (existing_emi + baseline_emi) / monthly_income
 
-        X = np.array([[monthly_income, loan_amount, credit_score]])
-        prediction = int(model.predict(X)[0])
-        confidence = int(round(float(model.predict_proba(X)[0][1] * 100)))
+        if isinstance(model, FallbackModel):
+            prediction, confidence = model.score(monthly_income, loan_amount, credit_score)
+        else:
+            pending = prediction_batcher.submit([monthly_income, loan_amount, credit_score])
+            try:
+                prediction, confidence = pending.result(timeout=PREDICTION_TIMEOUT)
+            except TimeoutError:
+                flash("Eligibility check timed out. Please try again.", "error")
+                return redirect(url_for("dashboard"))
 
         risk_label, risk_score = profile_risk(credit_score, foir, stability)
 
-        profile = {
-            "full_name": full_name,
-            "age": age,
-            "employment": employment,
-            "monthly_income": monthly_income,
-            "monthly_expenses": monthly_expenses,
-            "existing_emi": existing_emi,
-            "credit_score": credit_score,
-            "loan_amount": loan_amount,
-            "tenure_months": tenure_months,
-            "loan_type": loan_type,
-            "disposable_income": disposable_income,
-            "foir": foir,
-            "stability": stability,
-            "generated_at": datetime.now().strftime("%d %b %Y, %I:%M %p"),
-        }
+        profile = asdict(application)
+        profile.update(
+            disposable_income=disposable_income,
+            foir=foir,
+            stability=stability,
+            generated_at=_now_str(),
+        )
 
         offers = build_offers(profile, prediction, confidence)
 
@@ -326,4 +580,4 @@ def dashboard():
 
 
 if __name__ == "__main__":
-    app.run(debug=True)
+    app.run(debug=True)
@@ -0,0 +1,69 @@
+"""Check a _core build against the Python kernels in app.py.
+
+Run after ``python setup.py build_ext --inplace``. app.py uses the compiled kernels
+whenever _core imports and does not re-check them, so a build that disagrees with the
+Python scoring rules must not be deployed.
+"""
+
+import math
+import sys
+
+import numpy as np
+
+import _core
+
+# Keep app on its Python kernels so they can serve as the reference.
+sys.modules["_core"] = None
+import app  # noqa: E402
+
+sys.modules["_core"] = _core
+
+
+def compiled_kernels_match(core):
+    # Compare the compiled kernels with the Python ones on a grid straddling every rule threshold,
+    # so a stale _core build cannot silently change decisions.
+    credit_scores = (300, 649, 650, 699, 700, 719, 720, 759, 760, 900)
+    foirs = (0.2, 0.35, 0.4, 0.45, 0.5, 0.55, 0.7)
+    stabilities = (0.75, 0.8, 0.95, 1.0)
+
+    for rate in (0.0, 7.75, 8.35, 10.0, 11.8):
+        for months in (12, 60, 360):
+            if not math.isclose(core.emi_c(500000.0, rate, months), app.emi(500000.0, rate, months), rel_tol=1e-12):
+                return False
+
+    for credit_score in credit_scores:
+        for foir in foirs:
+            for stability in stabilities:
+                if core.profile_risk_c(credit_score, foir, stability) != app.profile_risk(credit_score, foir, stability):
+                    return False
+                for banks in app.BANKS_NP.values():
+                    for loan_amount, monthly_income in ((500000.0, 90000.0), (2500000.0, 40000.0)):
+                        args = (
+                            banks.base_rate,
+                            banks.min_credit,
+                            banks.max_foir,
+                            credit_score,
+                            foir,
+                            stability,
+                            loan_amount,
+                            60,
+                            monthly_income,
+                            5000.0,
+                            70,
+                        )
+                        compiled, python = core.score_banks_c(*args), app._score_banks(*args)
+                        if not (
+                            np.array_equal(compiled[0], python[0])
+                            and np.allclose(compiled[1], python[1], rtol=1e-12, atol=0)
+                            and np.allclose(compiled[2], python[2], rtol=1e-12, atol=0)
+                            and np.array_equal(compiled[3], python[3])
+                            and np.array_equal(compiled[4], python[4])
+                        ):
+                            return False
+    return True
+
+
+if __name__ == "__main__":
+    if not compiled_kernels_match(_core):
+        sys.exit("_core does not match the Python scoring rules in app.py; update _core.pyx and rebuild.")
+    print("_core matches the Python scoring rules.")
@@ -0,0 +1,5 @@
+from Cython.Build import cythonize
+from setuptools import setup
+
+# Only builds the optional compiled kernels: python setup.py build_ext --inplace
+setup(name="smartloan360-core", ext_modules=cythonize("_core.pyx"))